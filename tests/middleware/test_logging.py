@@ -1,5 +1,9 @@
 import contextlib
+import io
+import json
 import logging
+import time
+from datetime import datetime
 
 import httpx
 import pytest
@@ -7,7 +11,16 @@ import websockets
 
 from tests.utils import run_server
 from uvicorn import Config
+from uvicorn.logging import (
+    AccessFormatter,
+    AccessLogFields,
+    BufferedStreamHandler,
+    JSONAccessFormatter,
+    start_access_log_listener,
+    stop_access_log_listener,
+)
 from uvicorn.protocols.http.h11_impl import H11Protocol
+from uvicorn.protocols.utils import RequestResponseTiming
 
 try:
     from uvicorn.protocols.http.httptools_impl import HttpToolsProtocol
@@ -185,6 +198,8 @@ async def test_unknown_status_code(caplog):
         ("access: %(h)s", "access: 127.0.0.1"),
         ('access: "%({test-request-header}i)s"', 'access: "request-header-val"'),
         ('access: "%({test-response-header}o)s"', 'access: "response-header-val"'),
+        ('access: "%({Test-Request-Header}i)s"', 'access: "request-header-val"'),
+        ('access: "%({Test-Response-Header}o)s"', 'access: "response-header-val"'),
     ],
 )
 async def test_access_log_format(access_log_format, expected_output, caplog):
@@ -215,3 +230,270 @@ async def test_access_log_format(access_log_format, expected_output, caplog):
 
     assert len(access_log_messages) == 1
     assert access_log_messages[0] == expected_output
+
+
+@pytest.mark.parametrize(
+    "access_log_format",
+    [
+        '%(h)s %(l)s %(u)s "%(r)s" %(s)s %(b)s',
+        "{%(m)s} 100%% %(U)s?%(q)s %(H)s",
+        "%({test-request-header}i)s %({test-response-header}o)s %(unknown)s",
+        "%(s)5s|%(h)-12s|",
+    ],
+)
+def test_access_log_format_compiled(access_log_format):
+    fields = make_access_log_fields()
+    render = AccessLogFields.compile_format(access_log_format)
+    assert render(fields) == access_log_format % fields
+
+
+def test_access_log_fields_mapping():
+    fields = make_access_log_fields()
+    keys = list(fields)
+    assert len(keys) == len(fields)
+    assert "{test-request-header}i" in keys
+    assert "{test-response-header}o" in keys
+    assert dict(fields)["{test-response-header}o"] == "response-header-val"
+    assert fields["r"] == "GET /path?a=1 HTTP/1.1"
+    assert fields["U"] == "/path"
+    assert fields["q"] == "a=1"
+    # Header names are decoded as latin-1, so lookups round-trip through them.
+    fields.scope["headers"].append((b"x-caf\xe9", b"latte"))
+    assert dict(fields)["{x-caf\xe9}i"] == "latte"
+    assert fields["{\u65e5\u672c}i"] == "-"
+    # Looking up header atoms does not grow the class-level renderer cache.
+    assert len(AccessLogFields._ATOM_RENDERERS) == len(AccessLogFields.HANDLERS)
+
+
+def test_json_access_formatter():
+    fields = make_access_log_fields()
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 0, "json", (fields,), None
+    )
+    data = json.loads(JSONAccessFormatter().format(record))
+    assert data["remote_addr"] == "127.0.0.1"
+    assert data["method"] == "GET"
+    assert data["path"] == "/path"
+    assert data["query_string"] == "a=1"
+    assert data["status"] == 200
+    assert data["response_length"] == 5
+    assert data["referer"] is None
+    assert datetime.fromisoformat(data["time"]).timestamp() == pytest.approx(
+        record.created, abs=0.001
+    )
+
+
+@pytest.mark.anyio
+async def test_json_access_log_config(capsys, logging_config):
+    config = Config(app=app, log_config=logging_config, access_log_format="json")
+    async with run_server(config):
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                "http://127.0.0.1:8000/path?a=1", headers={"referer": "test"}
+            )
+    assert response.status_code == 204
+
+    data = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert data["method"] == "GET"
+    assert data["path"] == "/path"
+    assert data["query_string"] == "a=1"
+    assert data["status"] == 204
+    assert data["referer"] == "test"
+
+
+def test_formatter_colour_hooks():
+    class PlainColourFormatter(AccessFormatter):
+        level_name_colors = {logging.INFO: lambda level_name: f"<{level_name}>"}
+        status_code_colours = {2: lambda code: f"[{code}]"}
+
+    formatter = PlainColourFormatter("%(levelprefix)s %(status_code)s", use_colors=True)
+    record = logging.LogRecord(
+        "uvicorn.access",
+        logging.INFO,
+        __file__,
+        0,
+        '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:1234", "GET", "/", "1.1", 200),
+        None,
+    )
+    assert formatter.format(record) == "<INFO>:     [200 OK]"
+    assert formatter.format(record) == "<INFO>:     [200 OK]"
+
+
+def test_formatter_keeps_record_attributes():
+    formatter = AccessFormatter(
+        "%(levelprefix)s %(client_addr)s %(status_code)s", use_colors=False
+    )
+    record = logging.LogRecord(
+        "uvicorn.access",
+        logging.INFO,
+        __file__,
+        0,
+        '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:1234", "GET", "/", "1.1", 200),
+        None,
+    )
+    record.status_code = "from extra"
+    assert formatter.format(record) == "INFO:     127.0.0.1:1234 200 OK"
+    assert record.status_code == "from extra"
+    assert not hasattr(record, "levelprefix")
+    assert not hasattr(record, "client_addr")
+
+
+def test_access_log_date_uses_record_time():
+    fields = make_access_log_fields()
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 0, "%(t)s", (fields,), None
+    )
+    record.created = 1_000_000_000.0
+    formatter = AccessFormatter("%(message)s", use_colors=False)
+    expected = time.strftime("[%d/%b/%Y:%H:%M:%S %z]", time.localtime(1_000_000_000))
+    assert formatter.format(record) == expected
+
+
+def test_access_log_listener_handler_error():
+    class FailingHandler(logging.Handler):
+        def emit(self, record):
+            if record.getMessage() == "fail":
+                raise BrokenPipeError()
+            records.append(record)
+
+    records = []
+    handler = FailingHandler()
+    errors = []
+    handler.handleError = errors.append
+    logger = logging.getLogger("tests.listener_error")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        start_access_log_listener(logger)
+        logger.warning("fail")
+        logger.warning("logged")
+        stop_access_log_listener()
+
+        assert [record.getMessage() for record in errors] == ["fail"]
+        assert [record.getMessage() for record in records] == ["logged"]
+    finally:
+        stop_access_log_listener()
+        logger.removeHandler(handler)
+
+
+def make_access_log_fields():
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "path": "/path",
+        "raw_path": b"/path",
+        "query_string": b"a=1",
+        "headers": [(b"test-request-header", b'request-"header"-val')],
+        "client": ("127.0.0.1", 1234),
+    }
+    timing = RequestResponseTiming()
+    timing.request_started()
+    timing.response_ended()
+    fields = AccessLogFields(scope, timing)
+    fields.on_asgi_message(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"test-response-header", b"response-header-val")],
+        }
+    )
+    fields.on_asgi_message({"type": "http.response.body", "body": b"hello"})
+    return fields
+
+
+def test_buffered_stream_handler():
+    stream = io.StringIO()
+    handler = BufferedStreamHandler(stream, buffer_size=16, flush_interval=60)
+    logger = logging.getLogger("tests.buffered")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        logger.warning("one")
+        logger.warning("two")
+        assert stream.getvalue() == ""
+
+        logger.warning("three, over the buffer size")
+        assert stream.getvalue() == "one\ntwo\nthree, over the buffer size\n"
+
+        logger.warning("four")
+        handler.flush()
+        assert stream.getvalue().endswith("size\nfour\n")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_buffered_stream_handler_flush_interval():
+    stream = io.StringIO()
+    handler = BufferedStreamHandler(stream, flush_interval=0.01)
+    logger = logging.getLogger("tests.buffered_interval")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        logger.warning("one")
+        logger.warning("two")
+        for _ in range(100):
+            if stream.getvalue():
+                break
+            time.sleep(0.01)
+        assert stream.getvalue() == "one\ntwo\n"
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    assert handler._flush_thread is not None
+    handler._flush_thread.join(1)
+    assert not handler._flush_thread.is_alive()
+
+
+class BrokenStream(io.StringIO):
+    def write(self, s):
+        raise BrokenPipeError()
+
+
+@pytest.mark.parametrize("buffer_size", [1, 64 * 1024])
+def test_buffered_stream_handler_write_error(buffer_size):
+    handler = BufferedStreamHandler(
+        BrokenStream(), buffer_size=buffer_size, flush_interval=0.01
+    )
+    errors = []
+    handler.handleError = errors.append
+    logger = logging.getLogger("tests.buffered_error")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        logger.warning("lost")
+        for _ in range(100):
+            if errors:
+                break
+            time.sleep(0.01)
+        assert [record.getMessage() for record in errors] == ["lost"]
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_access_log_listener():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    logger = logging.getLogger("tests.listener")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        start_access_log_listener(logger)
+        assert handler not in logger.handlers
+        record = logger.makeRecord(
+            logger.name, logging.WARNING, __file__, 0, "queued %s", ("message",), None
+        )
+        # The queue handler is the only one left, so the record is not copied.
+        assert logger.handlers[0].prepare(record) is record
+        logger.warning("queued %s", "message")
+        stop_access_log_listener()
+
+        assert logger.handlers == [handler]
+        assert stream.getvalue() == "queued message\n"
+    finally:
+        stop_access_log_listener()
+        logger.removeHandler(handler)
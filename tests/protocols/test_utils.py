@@ -7,6 +7,7 @@ from uvicorn.protocols.utils import (
     RequestResponseTiming,
     get_client_addr,
     get_local_addr,
+    get_path_with_query_string,
     get_remote_addr,
 )
 
@@ -99,6 +100,19 @@ def test_get_client_addr(scope, expected_client):
     assert get_client_addr(scope) == expected_client
 
 
+@pytest.mark.parametrize(
+    "scope, expected_path",
+    [
+        ({"path": "/some/path-1_2.~", "query_string": b""}, "/some/path-1_2.~"),
+        ({"path": "/some path", "query_string": b""}, "/some%20path"),
+        ({"path": "/caf\u00e9", "query_string": b"a=1&b=2"}, "/caf%C3%A9?a=1&b=2"),
+    ],
+    ids=["safe path", "unsafe path", "path with query string"],
+)
+def test_get_path_with_query_string(scope, expected_path):
+    assert get_path_with_query_string(scope) == expected_path
+
+
 def test_request_response_timing_request_duration_seconds():
     timing = RequestResponseTiming()
     with pytest.raises(ValueError):
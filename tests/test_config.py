@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import pickle
 import socket
 import sys
 import typing
@@ -14,6 +15,7 @@ from pytest_mock import MockerFixture
 from tests.utils import as_cwd
 from uvicorn._types import Environ, StartResponse
 from uvicorn.config import Config
+from uvicorn.logging import AccessLogQueueHandler, stop_access_log_listener
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from uvicorn.middleware.wsgi import WSGIMiddleware
 from uvicorn.protocols.http.h11_impl import H11Protocol
@@ -480,6 +482,36 @@ def test_config_access_log(access_log: bool, handlers: int) -> None:
     assert config.access_log == access_log
 
 
+def test_config_access_log_listener(logging_config: dict) -> None:
+    access_logger = logging.getLogger("uvicorn.access")
+    try:
+        # Only the default logging config is served from the listener thread.
+        Config(app=asgi_app, log_config=logging_config)
+        assert not any(
+            isinstance(handler, AccessLogQueueHandler)
+            for handler in access_logger.handlers
+        )
+
+        Config(app=asgi_app)
+        assert [type(handler) for handler in access_logger.handlers] == [
+            AccessLogQueueHandler
+        ]
+    finally:
+        stop_access_log_listener()
+
+
+def test_config_access_log_listener_pickled() -> None:
+    # Worker and reload processes configure logging from a pickled config.
+    config = pickle.loads(pickle.dumps(Config(app=asgi_app)))
+    try:
+        config.configure_logging()
+        assert [
+            type(handler) for handler in logging.getLogger("uvicorn.access").handlers
+        ] == [AccessLogQueueHandler]
+    finally:
+        stop_access_log_listener()
+
+
 @pytest.mark.parametrize("log_level", [5, 10, 20, 30, 40, 50])
 def test_config_log_level(log_level: int) -> None:
     config = Config(app=asgi_app, log_level=log_level)
@@ -23,7 +23,11 @@ from typing import (
 
 from h11._connection import DEFAULT_MAX_INCOMPLETE_EVENT_SIZE
 
-from uvicorn.logging import TRACE_LOG_LEVEL
+from uvicorn.logging import (
+    TRACE_LOG_LEVEL,
+    start_access_log_listener,
+    stop_access_log_listener,
+)
 
 if sys.version_info < (3, 8):  # pragma: py-gte-38
     from typing_extensions import Literal
@@ -111,7 +115,7 @@ LOGGING_CONFIG: Dict[str, Any] = {
         },
         "access": {
             "formatter": "access",
-            "class": "logging.StreamHandler",
+            "class": "uvicorn.logging.BufferedStreamHandler",
             "stream": "ext://sys.stdout",
         },
     },
@@ -267,6 +271,9 @@ class Config:
         self.ws_per_message_deflate = ws_per_message_deflate
         self.lifespan = lifespan
         self.log_config = log_config
+        # Decided here rather than in configure_logging(), as the identity check
+        # does not survive pickling the config into worker/reload processes.
+        self.default_log_config = log_config is LOGGING_CONFIG
         self.log_level = log_level
         self.access_log = access_log
         self.access_log_format = access_log_format
@@ -393,6 +400,8 @@ class Config:
 
     def configure_logging(self) -> None:
         logging.addLevelName(TRACE_LOG_LEVEL, "TRACE")
+        # Hand the access log handlers back before they get reconfigured.
+        stop_access_log_listener()
 
         if self.log_config is not None:
             if isinstance(self.log_config, dict):
@@ -403,7 +412,11 @@ class Config:
                     self.log_config["formatters"]["access"][
                         "use_colors"
                     ] = self.use_colors
-                if self.access_log_format:
+                if self.access_log_format == "json":
+                    formatters = dict(self.log_config["formatters"])
+                    formatters["access"] = {"()": "uvicorn.logging.JSONAccessFormatter"}
+                    self.log_config = {**self.log_config, "formatters": formatters}
+                elif self.access_log_format:
                     self.log_config["formatters"]["access"][
                         "fmt"
                     ] = "%(levelprefix)s %(message)s"
@@ -434,6 +447,11 @@ class Config:
         if self.access_log is False:
             logging.getLogger("uvicorn.access").handlers = []
             logging.getLogger("uvicorn.access").propagate = False
+        elif self.default_log_config:
+            # Format and write the access log from a background thread, rather
+            # than on the event loop. Handlers from a user supplied log config
+            # stay where they are, as they may depend on request-local state.
+            start_access_log_listener(logging.getLogger("uvicorn.access"))
 
     def load(self) -> None:
         assert not self.loaded
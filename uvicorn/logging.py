@@ -1,12 +1,30 @@
+import functools
 import http
+import json
 import logging
+import logging.handlers
+import re
 import sys
+import threading
 import time
 import typing
 from collections import abc
 from copy import copy
+from datetime import datetime
 from os import getpid
-from typing import Callable, Dict, Iterator, Optional, cast
+from queue import SimpleQueue
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import click
 
@@ -22,6 +40,50 @@ if typing.TYPE_CHECKING:
 
 TRACE_LOG_LEVEL = 5
 
+# The escapes `click.style(text, bold=True)` wraps the text in.
+ANSI_BOLD = "\x1b[1m"
+ANSI_RESET = "\x1b[0m"
+
+# ANSI colour escapes for the status code categories 1xx to 5xx, the same
+# `click.style()` produces for bright_white, green, yellow, red and bright_red.
+STATUS_CODE_COLOURS: Tuple[str, ...] = (
+    "",
+    "\x1b[97m",
+    "\x1b[32m",
+    "\x1b[33m",
+    "\x1b[31m",
+    "\x1b[91m",
+)
+
+
+def _ansi_style(prefix: str) -> Callable[[str], str]:
+    return lambda text: prefix + text + ANSI_RESET
+
+
+@functools.lru_cache(maxsize=2)
+def _format_request_date(timestamp: int) -> str:
+    # Only changes once per second, so requests logged within the same second
+    # share the formatted date.
+    return time.strftime("[%d/%b/%Y:%H:%M:%S %z]", time.localtime(timestamp))
+
+
+_MISSING = object()
+
+
+def _restore_record_attributes(
+    record_dict: Dict[str, Any], saved: Dict[str, Any]
+) -> None:
+    """Put back attributes a formatter set on a record while formatting it.
+
+    `saved` maps each attribute to the value it had before, or to `_MISSING`
+    if the record did not have it, in which case it is deleted again.
+    """
+    for key, value in saved.items():
+        if value is _MISSING:
+            del record_dict[key]
+        else:
+            record_dict[key] = value
+
 
 class ColourizedFormatter(logging.Formatter):
     """
@@ -55,6 +117,9 @@ class ColourizedFormatter(logging.Formatter):
         else:
             self.use_colors = sys.stdout.isatty()
         super().__init__(fmt=fmt, datefmt=datefmt, style=style)
+        # Level prefixes only depend on the level, so they are built once per
+        # level instead of for every record.
+        self._level_prefixes: Dict[Tuple[int, str, bool], str] = {}
 
     def color_level_name(self, level_name: str, level_no: int) -> str:
         def default(level_name: str) -> str:
@@ -63,20 +128,44 @@ class ColourizedFormatter(logging.Formatter):
         func = self.level_name_colors.get(level_no, default)
         return func(level_name)
 
+    def get_level_prefix(self, level_name: str, level_no: int) -> str:
+        key = (level_no, level_name, self.use_colors)
+        try:
+            return self._level_prefixes[key]
+        except KeyError:
+            seperator = " " * (8 - len(level_name))
+            if self.use_colors:
+                level_name = self.color_level_name(level_name, level_no)
+            levelprefix = self._level_prefixes[key] = level_name + ":" + seperator
+            return levelprefix
+
     def should_use_colors(self) -> bool:
         return True  # pragma: no cover
 
     def formatMessage(self, record: logging.LogRecord) -> str:
-        recordcopy = copy(record)
-        levelname = recordcopy.levelname
-        seperator = " " * (8 - len(recordcopy.levelname))
-        if self.use_colors:
-            levelname = self.color_level_name(levelname, recordcopy.levelno)
-            if "color_message" in recordcopy.__dict__:
-                recordcopy.msg = recordcopy.__dict__["color_message"]
-                recordcopy.__dict__["message"] = recordcopy.getMessage()
-        recordcopy.__dict__["levelprefix"] = levelname + ":" + seperator
-        return super().formatMessage(recordcopy)
+        # Rather than formatting a copy of the record, the extra attributes are
+        # set on the record itself and restored once it has been formatted.
+        record_dict = record.__dict__
+        saved = {"levelprefix": record_dict.get("levelprefix", _MISSING)}
+        levelprefix = self.get_level_prefix(record.levelname, record.levelno)
+        record_dict["levelprefix"] = levelprefix
+        try:
+            if self.use_colors and "color_message" in record_dict:
+                saved["message"] = record_dict.get("message", _MISSING)
+                color_message = record_dict["color_message"]
+                if record.args:
+                    msg = record.msg
+                    record.msg = color_message
+                    try:
+                        record_dict["message"] = record.getMessage()
+                    finally:
+                        record.msg = msg
+                else:
+                    # Without arguments there is nothing to interpolate.
+                    record_dict["message"] = str(color_message)
+            return super().formatMessage(record)
+        finally:
+            _restore_record_attributes(record_dict, saved)
 
 
 class DefaultFormatter(ColourizedFormatter):
@@ -85,15 +174,31 @@ class DefaultFormatter(ColourizedFormatter):
 
 
 class AccessFormatter(ColourizedFormatter):
+    # Built from the precomputed escapes rather than calling `click.style()`,
+    # but still a mapping subclasses can override to change the colours.
     status_code_colours = {
-        1: lambda code: click.style(str(code), fg="bright_white"),
-        2: lambda code: click.style(str(code), fg="green"),
-        3: lambda code: click.style(str(code), fg="yellow"),
-        4: lambda code: click.style(str(code), fg="red"),
-        5: lambda code: click.style(str(code), fg="bright_red"),
+        category: _ansi_style(prefix)
+        for category, prefix in enumerate(STATUS_CODE_COLOURS)
+        if prefix
     }
 
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: Literal["%", "{", "$"] = "%",
+        use_colors: Optional[bool] = None,
+    ):
+        super().__init__(fmt=fmt, datefmt=datefmt, style=style, use_colors=use_colors)
+        self._access_log_renderers: Dict[str, "AccessLogRenderer"] = {}
+        self._status_codes: Dict[Tuple[int, bool], str] = {}
+
     def get_status_code(self, status_code: int) -> str:
+        key = (status_code, self.use_colors)
+        try:
+            return self._status_codes[key]
+        except KeyError:
+            pass
         try:
             status_phrase = http.HTTPStatus(status_code).phrase
         except ValueError:
@@ -101,36 +206,292 @@ class AccessFormatter(ColourizedFormatter):
         status_and_phrase = "%s %s" % (status_code, status_phrase)
         if self.use_colors:
 
-            def default(code: int) -> str:
+            def default(code: str) -> str:
                 return status_and_phrase  # pragma: no cover
 
             func = self.status_code_colours.get(status_code // 100, default)
-            return func(status_and_phrase)
+            status_and_phrase = func(status_and_phrase)
+        # Only three digit codes are remembered, which keeps the cache bounded.
+        if 100 <= status_code < 1000:
+            self._status_codes[key] = status_and_phrase
         return status_and_phrase
 
+    def get_access_log_renderer(self, access_log_format: str) -> "AccessLogRenderer":
+        try:
+            return self._access_log_renderers[access_log_format]
+        except KeyError:
+            renderer = AccessLogFields.compile_format(access_log_format)
+            self._access_log_renderers[access_log_format] = renderer
+            return renderer
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = record.args
+        if isinstance(fields, AccessLogFields):
+            fields.log_time = record.created
+        if (
+            not isinstance(fields, AccessLogFields)
+            or record.exc_info
+            or record.stack_info
+        ):
+            return super().format(record)
+        # Render custom access log formats with the precompiled renderer
+        # instead of `LogRecord.getMessage()`, which would look every atom up
+        # through the mapping interface.
+        renderer = self.get_access_log_renderer(str(record.msg))
+        record.message = renderer(fields)
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self.formatMessage(record)
+
     def formatMessage(self, record: logging.LogRecord) -> str:
-        if len(getattr(record, "args")) != 5:
+        args = record.args
+        if not isinstance(args, tuple) or len(args) != 5:
             return super().formatMessage(record)
-        recordcopy = copy(record)
         (
             client_addr,
             method,
             full_path,
             http_version,
             status_code,
-        ) = recordcopy.args  # type: ignore[misc]
+        ) = record.args  # type: ignore[misc]
         status_code = self.get_status_code(int(status_code))  # type: ignore[arg-type]
         request_line = "%s %s HTTP/%s" % (method, full_path, http_version)
         if self.use_colors:
-            request_line = click.style(request_line, bold=True)
-        recordcopy.__dict__.update(
+            request_line = ANSI_BOLD + request_line + ANSI_RESET
+        record_dict = record.__dict__
+        get = record_dict.get
+        saved = {
+            "client_addr": get("client_addr", _MISSING),
+            "request_line": get("request_line", _MISSING),
+            "status_code": get("status_code", _MISSING),
+        }
+        record_dict["client_addr"] = client_addr
+        record_dict["request_line"] = request_line
+        record_dict["status_code"] = status_code
+        try:
+            return super().formatMessage(record)
+        finally:
+            _restore_record_attributes(record_dict, saved)
+
+
+class JSONAccessFormatter(logging.Formatter):
+    """
+    Formats access log records as one JSON object per line.
+
+    Used for `--access-log-format json`. The JSON is serialized with `orjson`
+    if it is installed, and with the standard library `json` otherwise.
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: Literal["%", "{", "$"] = "%",
+    ):
+        super().__init__(fmt=fmt, datefmt=datefmt, style=style)
+        self._dumps: Callable[[Dict[str, Any]], str]
+        try:
+            import orjson
+        except ImportError:  # pragma: no cover
+            self._dumps = functools.partial(
+                json.dumps, ensure_ascii=False, separators=(",", ":")
+            )
+        else:
+            self._dumps = lambda data: orjson.dumps(data).decode()
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        # ISO 8601 with the UTC offset, e.g. "2026-10-15T06:20:26.036+00:00".
+        return (
+            datetime.fromtimestamp(record.created)
+            .astimezone()
+            .isoformat(timespec="milliseconds")
+        )
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = record.args
+        if not isinstance(fields, AccessLogFields):
+            return self._dumps(
+                {
+                    "time": self.formatTime(record, self.datefmt),
+                    "level": record.levelname,
+                    "message": record.getMessage(),
+                }
+            )
+        return self._dumps(
             {
-                "client_addr": client_addr,
-                "request_line": request_line,
-                "status_code": status_code,
+                "time": self.formatTime(record, self.datefmt),
+                "remote_addr": fields._remote_address(),
+                "method": fields.request_method(),
+                "path": fields.url_path(),
+                "query_string": fields.query_string(),
+                "protocol": fields.protocol(),
+                "status": fields.status_code,
+                "response_length": fields._response_length,
+                "referer": fields.referer(),
+                "user_agent": fields.user_agent(),
+                "duration": fields.duration,
+                "pid": record.process,
             }
         )
-        return super().formatMessage(recordcopy)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    A stream handler that writes formatted records to the stream in batches.
+
+    Records are buffered until more than `buffer_size` characters are pending,
+    and are then written out with a single write. A single daemon thread
+    writes out whatever is still buffered every `flush_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+    ):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._buffered_size = 0
+        self._last_record: Optional[logging.LogRecord] = None
+        self._closed = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            self._buffer.append(msg)
+            self._buffered_size += len(msg)
+            self._last_record = record
+            if self._buffered_size >= self.buffer_size:
+                self.flush()
+        except Exception:
+            # Like `logging.StreamHandler.emit()`, errors writing to the stream
+            # are reported instead of raised into the logging call.
+            self.handleError(record)
+            return
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically,
+                name="uvicorn-log-flush",
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            record = self._last_record
+            # Leave the stream alone while there is nothing to write.
+            if record is not None and self._buffer:
+                try:
+                    self.flush()
+                except Exception:
+                    self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._buffer:
+                data = "".join(self._buffer)
+                self._buffer.clear()
+                self._buffered_size = 0
+                self.stream.write(data)
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self._closed.set()
+        self.flush()
+        super().close()
+
+
+class AccessLogQueueHandler(logging.handlers.QueueHandler):
+    """
+    A queue handler that leaves formatting the record to the queue listener.
+    """
+
+    def __init__(
+        self, queue: "SimpleQueue[logging.LogRecord]", logger: logging.Logger
+    ) -> None:
+        super().__init__(queue)  # type: ignore[arg-type]
+        self.logger = logger
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        logger = self.logger
+        if logger.propagate or len(logger.handlers) > 1:
+            # The listener thread formats the record while other handlers may
+            # still be working on it, so it gets its own copy.
+            return copy(record)
+        return record
+
+
+class AccessLogQueueListener(logging.handlers.QueueListener):
+    """
+    Serves the handlers of the access logger from a background thread.
+
+    While the listener is running, the logger only holds an
+    `AccessLogQueueHandler`, so logging a request on the event loop is a
+    single queue put, and the records are formatted and written out by the
+    original handlers in the listener thread.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        queue: "SimpleQueue[logging.LogRecord]" = SimpleQueue()
+        super().__init__(queue, *logger.handlers, respect_handler_level=True)
+        self.logger = logger
+        self.queue_handler = AccessLogQueueHandler(queue, logger)
+
+    def start(self) -> None:
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.queue_handler)
+        super().start()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                # An error escaping here would end the listener thread, and
+                # with it the access log, while records keep being queued.
+                handler.handleError(record)
+
+    def stop(self) -> None:
+        super().stop()
+        self.logger.removeHandler(self.queue_handler)
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+            handler.flush()
+
+
+_access_log_listener: Optional[AccessLogQueueListener] = None
+
+
+def start_access_log_listener(logger: logging.Logger) -> None:
+    """Serve the current handlers of `logger` from a background thread."""
+    global _access_log_listener
+    stop_access_log_listener()
+    if logger.handlers:
+        _access_log_listener = AccessLogQueueListener(logger)
+        _access_log_listener.start()
+
+
+def stop_access_log_listener() -> None:
+    """Stop the listener thread, handing its handlers back to the logger."""
+    global _access_log_listener
+    if _access_log_listener is not None:
+        _access_log_listener.stop()
+        _access_log_listener = None
 
 
 class AccessLogFields(abc.Mapping):  # pragma: no cover
@@ -143,6 +504,18 @@ class AccessLogFields(abc.Mapping):  # pragma: no cover
     - escape double quotes found in fields strings
     """
 
+    __slots__ = (
+        "scope",
+        "timing",
+        "status_code",
+        "response_headers",
+        "_response_length",
+        "_request_headers",
+        "_raw_path",
+        "_query_string",
+        "log_time",
+    )
+
     def __init__(
         self,
         scope: "HTTPScope",
@@ -151,19 +524,39 @@ class AccessLogFields(abc.Mapping):  # pragma: no cover
         self.scope = scope
         self.timing = timing
         self.status_code: Optional[int] = None
-        self.response_headers: Dict[str, str] = {}
+        self.response_headers: List[Tuple[bytes, bytes]] = []
         self._response_length = 0
 
         self._request_headers: Optional[Dict[str, str]] = None
+        self._raw_path: Optional[str] = None
+        self._query_string: Optional[str] = None
+        # When the request was logged, set by the formatter from the record,
+        # so that formatting it later on the listener thread keeps the time.
+        self.log_time: Optional[float] = None
 
     @property
     def request_headers(self) -> Dict[str, str]:
         if self._request_headers is None:
             self._request_headers = {
-                k.decode("ascii"): v.decode("ascii") for k, v in self.scope["headers"]
+                k.decode("latin-1"): v.decode("latin-1")
+                for k, v in self.scope["headers"]
             }
         return self._request_headers
 
+    # The raw path and query string are decoded at most once, as several atoms
+    # (e.g. `r`, `U` and `q`) may use them in the same format.
+    @property
+    def decoded_raw_path(self) -> str:
+        if self._raw_path is None:
+            self._raw_path = self.scope["raw_path"].decode("latin-1")
+        return self._raw_path
+
+    @property
+    def decoded_query_string(self) -> str:
+        if self._query_string is None:
+            self._query_string = self.scope["query_string"].decode("latin-1")
+        return self._query_string
+
     @property
     def duration(self) -> float:
         return self.timing.total_duration_seconds()
@@ -171,18 +564,25 @@ class AccessLogFields(abc.Mapping):  # pragma: no cover
     def on_asgi_message(self, message: "ASGISendEvent") -> None:
         if message["type"] == "http.response.start":
             self.status_code = message["status"]
-            self.response_headers = {
-                k.decode("ascii"): v.decode("ascii")
-                for k, v in message.get("headers", {})
-            }
+            self.response_headers = list(message.get("headers", []))
         elif message["type"] == "http.response.body":
             self._response_length += len(message.get("body", ""))
 
-    def _request_header(self, key: str) -> Optional[str]:
-        return self.request_headers.get(key.lower())
-
-    def _response_header(self, key: str) -> Optional[str]:
-        return self.response_headers.get(key.lower())
+    # Single headers are looked up against the raw header lists, so that a
+    # format using one header does not need to decode all of them.
+    def _request_header(self, key: bytes) -> Optional[str]:
+        """Return the value of a request header, `key` being lowercase bytes."""
+        for k, v in self.scope["headers"]:
+            if k == key:
+                return v.decode("latin-1")
+        return None
+
+    def _response_header(self, key: bytes) -> Optional[str]:
+        """Return the value of a response header, `key` being lowercase bytes."""
+        for k, v in self.response_headers:
+            if k.lower() == key:
+                return v.decode("latin-1")
+        return None
 
     def _wsgi_environ_variable(self, key: str) -> None:
         # FIXME: provide fallbacks to access WSGI environ (at least the
@@ -198,130 +598,183 @@ class AccessLogFields(abc.Mapping):  # pragma: no cover
         return val
 
     def __getitem__(self, key: str) -> str:
-        retval: Optional[str]
-        if key in self.HANDLERS:
-            retval = self.HANDLERS[key](self)
-        elif key.startswith("{"):
-            if key.endswith("}i"):
-                retval = self._request_header(key[1:-2])
-            elif key.endswith("}o"):
-                retval = self._response_header(key[1:-2])
-            elif key.endswith("}e"):
-                # retval = self._wsgi_environ_variable(key[1:-2])
-                raise NotImplementedError("WSGI environ not supported")
+        renderer = self._ATOM_RENDERERS.get(key)
+        if renderer is None:
+            # Header atoms are resolved per lookup rather than cached, as their
+            # names come from the request.
+            renderer = self._compile_atom(key)
+        return renderer(self)
+
+    _FORMAT_ATOM_RE = re.compile(r"%(?:\(([^)]*)\)s|%)")
+
+    @classmethod
+    def compile_format(cls, fmt: str) -> "AccessLogRenderer":
+        """Compile an access log format into a function rendering it.
+
+        The format is parsed once and every atom is resolved to the callable
+        producing it, so rendering a request does not go through the mapping
+        interface. Formats using anything but `%(...)s` atoms and `%%` fall
+        back to plain `%` formatting.
+        """
+        template: List[str] = []
+        getters: List[AccessLogRenderer] = []
+        position = 0
+        for match in cls._FORMAT_ATOM_RE.finditer(fmt):
+            literal = fmt[position : match.start()]
+            if "%" in literal:
+                return lambda fields: fmt % fields
+            template.append(literal.replace("{", "{{").replace("}", "}}"))
+            key = match.group(1)
+            if key is None:
+                template.append("%")
             else:
-                retval = None
-        else:
-            retval = None
-        return self._log_format_atom(retval)
+                template.append("{}")
+                getters.append(cls._compile_atom(key))
+            position = match.end()
+        literal = fmt[position:]
+        if "%" in literal:
+            return lambda fields: fmt % fields
+        template.append(literal.replace("{", "{{").replace("}", "}}"))
 
-    _LogAtomHandler = Callable[["AccessLogFields"], Optional[str]]
-    HANDLERS: Dict[str, _LogAtomHandler] = {}
+        render_template = "".join(template).format
 
-    # mypy does not understand class-member decorators:
-    #
-    # https://github.com/python/mypy/issues/7778
-    def _register_handler(  # type: ignore[misc]
-        key: str, handlers: Dict[str, _LogAtomHandler] = HANDLERS
-    ) -> Callable[[_LogAtomHandler], _LogAtomHandler]:
-        _LogAtomHandler = Callable[["AccessLogFields"], Optional[str]]
+        def render(fields: "AccessLogFields") -> str:
+            return render_template(*[getter(fields) for getter in getters])
 
-        def decorator(fn: _LogAtomHandler) -> _LogAtomHandler:
-            handlers[key] = fn
-            return fn
+        return render
 
-        return decorator
+    @classmethod
+    def _compile_atom(cls, key: str) -> "AccessLogRenderer":
+        log_format_atom = cls._log_format_atom
+        if key in cls.HANDLERS:
+            handler = cls.HANDLERS[key]
+            return lambda fields: log_format_atom(handler(fields))
+        if key.startswith("{"):
+            try:
+                name = key[1:-2].lower().encode("latin-1")
+            except UnicodeEncodeError:
+                # Header names are latin-1, so no header can match this one.
+                name = b""
+            if key.endswith("}i"):
+                return lambda fields: log_format_atom(fields._request_header(name))
+            if key.endswith("}o"):
+                return lambda fields: log_format_atom(fields._response_header(name))
+            if key.endswith("}e"):
+
+                def wsgi_environ_variable(fields: "AccessLogFields") -> str:
+                    raise NotImplementedError("WSGI environ not supported")
+
+                return wsgi_environ_variable
+        return lambda fields: "-"
+
+    _LogAtomHandler = Callable[["AccessLogFields"], Optional[str]]
+    # These are filled in below the class body, once the handlers are defined.
+    HANDLERS: ClassVar[Dict[str, _LogAtomHandler]]
+    _N_HANDLERS: ClassVar[int]
+    _ATOM_RENDERERS: ClassVar[Dict[str, "AccessLogRenderer"]]
 
-    @_register_handler("h")
     def _remote_address(self) -> Optional[str]:
-        client: tuple = cast(tuple, self.scope.get("client", ()))
-        return client[0]
+        client = self.scope.get("client")
+        return client[0] if client else None
 
-    @_register_handler("l")
     def _dash(self) -> str:
         return "-"
 
-    @_register_handler("u")
     def _user_name(self) -> Optional[str]:
         pass
 
-    @_register_handler("t")
     def date_of_the_request(self) -> Optional[str]:
         """Date and time in Apache Common Log Format"""
-        return time.strftime("[%d/%b/%Y:%H:%M:%S %z]")
+        log_time = self.log_time
+        if log_time is None:
+            log_time = time.time()
+        return _format_request_date(int(log_time))
 
-    @_register_handler("r")
     def status_line(self) -> Optional[str]:
-        full_raw_path = self.scope["raw_path"] + self.scope["query_string"]
-        full_path = full_raw_path.decode("ascii")
-        return "{method} {full_path} HTTP/{http_version}".format(
-            full_path=full_path, **self.scope
-        )
+        full_path = self.decoded_raw_path
+        query_string = self.decoded_query_string
+        if query_string:
+            full_path = f"{full_path}?{query_string}"
+        scope = self.scope
+        return f"{scope['method']} {full_path} HTTP/{scope['http_version']}"
 
-    @_register_handler("m")
     def request_method(self) -> Optional[str]:
         return self.scope["method"]
 
-    @_register_handler("U")
     def url_path(self) -> Optional[str]:
-        return self.scope["raw_path"].decode("ascii")
+        return self.decoded_raw_path
 
-    @_register_handler("q")
     def query_string(self) -> Optional[str]:
-        return self.scope["query_string"].decode("ascii")
+        return self.decoded_query_string
 
-    @_register_handler("H")
     def protocol(self) -> Optional[str]:
         return "HTTP/%s" % self.scope["http_version"]
 
-    @_register_handler("s")
     def status(self) -> Optional[str]:
         return str(self.status_code) or "-"
 
-    @_register_handler("B")
     def response_length(self) -> Optional[str]:
         return str(self._response_length)
 
-    @_register_handler("b")
     def response_length_or_dash(self) -> Optional[str]:
         return str(self._response_length or "-")
 
-    @_register_handler("f")
     def referer(self) -> Optional[str]:
-        return self.request_headers.get("referer")
+        return self._request_header(b"referer")
 
-    @_register_handler("a")
     def user_agent(self) -> Optional[str]:
-        return self.request_headers.get("user-agent")
+        return self._request_header(b"user-agent")
 
-    @_register_handler("T")
     def request_time_seconds(self) -> Optional[str]:
-        return str(int(self.duration))
+        return str(self.timing.total_duration_ns() // 1_000_000_000)
 
-    @_register_handler("D")
     def request_time_microseconds(self) -> str:
-        return str(int(self.duration * 1_000_000))
+        return str(self.timing.total_duration_ns() // 1000)
 
-    @_register_handler("L")
     def request_time_decimal_seconds(self) -> str:
         return "%.6f" % self.duration
 
-    @_register_handler("p")
     def process_id(self) -> str:
         return "<%s>" % getpid()
 
     def __iter__(self) -> Iterator[str]:
         # FIXME: add WSGI environ
         yield from self.HANDLERS
+        # Request header names are already lowercase in the scope.
         for k, _ in self.scope["headers"]:
-            ks = k.decode("utf-8").lower()
-            yield f"{ks}i"
-        header_keys: list = list(self.response_headers.keys())
-        for k in header_keys:
-            ks = k.decode("utf-8").lower()
-            yield f"{ks}o"
+            yield "{%s}i" % k.decode("latin-1")
+        for k, _ in self.response_headers:
+            yield "{%s}o" % k.decode("latin-1").lower()
 
     def __len__(self) -> int:
         # FIXME: add WSGI environ
         headers: tuple = cast(tuple, self.scope.get("headers", ()))
-        return len(self.HANDLERS) + len(headers) + len(self.response_headers)
+        return self._N_HANDLERS + len(headers) + len(self.response_headers)
+
+
+AccessLogFields.HANDLERS = {
+    "h": AccessLogFields._remote_address,
+    "l": AccessLogFields._dash,
+    "u": AccessLogFields._user_name,
+    "t": AccessLogFields.date_of_the_request,
+    "r": AccessLogFields.status_line,
+    "m": AccessLogFields.request_method,
+    "U": AccessLogFields.url_path,
+    "q": AccessLogFields.query_string,
+    "H": AccessLogFields.protocol,
+    "s": AccessLogFields.status,
+    "B": AccessLogFields.response_length,
+    "b": AccessLogFields.response_length_or_dash,
+    "f": AccessLogFields.referer,
+    "a": AccessLogFields.user_agent,
+    "T": AccessLogFields.request_time_seconds,
+    "D": AccessLogFields.request_time_microseconds,
+    "L": AccessLogFields.request_time_decimal_seconds,
+    "p": AccessLogFields.process_id,
+}
+AccessLogFields._N_HANDLERS = len(AccessLogFields.HANDLERS)
+AccessLogFields._ATOM_RENDERERS = {
+    key: AccessLogFields._compile_atom(key) for key in AccessLogFields.HANDLERS
+}
+
+AccessLogRenderer = Callable[[AccessLogFields], str]
@@ -537,6 +537,7 @@ def run(
         log_config=log_config,
         log_level=log_level,
         access_log=access_log,
+        access_log_format=access_log_format,
         proxy_headers=proxy_headers,
         server_header=server_header,
         date_header=date_header,
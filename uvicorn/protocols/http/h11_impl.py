@@ -80,7 +80,9 @@ class H11Protocol(asyncio.Protocol):
         self.loop = _loop or asyncio.get_event_loop()
         self.logger = logging.getLogger("uvicorn.error")
         self.access_logger = logging.getLogger("uvicorn.access")
-        self.access_log = self.access_logger.hasHandlers()
+        self.access_log = self.access_logger.hasHandlers() and (
+            self.access_logger.isEnabledFor(logging.INFO)
+        )
         self.conn = h11.Connection(h11.SERVER, config.h11_max_incomplete_event_size)
         self.ws_protocol_class = config.ws_protocol_class
         self.root_path = config.root_path
@@ -409,8 +411,10 @@ class RequestResponseCycle:
         self.response_complete = False
         self.timing = RequestResponseTiming()
 
-        # For logging
-        self.access_log_fields = AccessLogFields(self.scope, self.timing)
+        # For logging, only collected when the access log is enabled.
+        self.access_log_fields: Optional[AccessLogFields] = None
+        if access_log:
+            self.access_log_fields = AccessLogFields(self.scope, self.timing)
 
     # ASGI exception wrapper
     async def run_asgi(self, app: "ASGI3Application") -> None:
@@ -527,7 +531,7 @@ class RequestResponseCycle:
 
                 self.timing.response_ended()
 
-                if self.access_log:
+                if self.access_log_fields is not None:
                     if self.access_log_format is None:
                         self.access_logger.info(
                             '%s - "%s %s HTTP/%s" %d',
@@ -79,7 +79,9 @@ class HttpToolsProtocol(asyncio.Protocol):
         self.loop = _loop or asyncio.get_event_loop()
         self.logger = logging.getLogger("uvicorn.error")
         self.access_logger = logging.getLogger("uvicorn.access")
-        self.access_log = self.access_logger.hasHandlers()
+        self.access_log = self.access_logger.hasHandlers() and (
+            self.access_logger.isEnabledFor(logging.INFO)
+        )
         self.access_log_format = config.access_log_format
         self.parser = httptools.HttpRequestParser(self)
         self.ws_protocol_class = config.ws_protocol_class
@@ -108,7 +110,7 @@ class HttpToolsProtocol(asyncio.Protocol):
         self.headers: List[Tuple[bytes, bytes]] = None  # type: ignore[assignment]
         self.expect_100_continue = False
         self.cycle: RequestResponseCycle = None  # type: ignore[assignment]
-        self.request_start_time: Optional[float] = None
+        self.request_start_time: Optional[int] = None
 
     # Protocol interface
     def connection_made(  # type: ignore[override]
@@ -230,7 +232,7 @@ class HttpToolsProtocol(asyncio.Protocol):
         self.transport.close()
 
     def on_message_begin(self) -> None:
-        self.request_start_time = time.monotonic()
+        self.request_start_time = time.perf_counter_ns()
         self.url = b""
         self.expect_100_continue = False
         self.headers = []
@@ -298,7 +300,7 @@ class HttpToolsProtocol(asyncio.Protocol):
             keep_alive=http_version != "1.0",
             on_response=self.on_response_complete,
         )
-        self.cycle.timing._request_start_time = self.request_start_time
+        self.cycle.timing.request_started(self.request_start_time)
         if existing_cycle is None or existing_cycle.response_complete:
             # Standard case - start processing the request.
             task = self.loop.create_task(self.cycle.run_asgi(app))
@@ -425,8 +427,10 @@ class RequestResponseCycle:
         self.expected_content_length = 0
         self.timing = RequestResponseTiming()
 
-        # For logging.
-        self.access_log_fields = AccessLogFields(self.scope, self.timing)
+        # For logging, only collected when the access log is enabled.
+        self.access_log_fields: Optional[AccessLogFields] = None
+        if access_log:
+            self.access_log_fields = AccessLogFields(self.scope, self.timing)
 
     # ASGI exception wrapper
     async def run_asgi(self, app: "ASGI3Application") -> None:
@@ -484,7 +488,8 @@ class RequestResponseCycle:
         if self.disconnected:
             return
 
-        self.access_log_fields.on_asgi_message(message)
+        if self.access_log_fields is not None:
+            self.access_log_fields.on_asgi_message(message)
 
         if not self.response_started:
             # Sending response status line and headers
@@ -572,7 +577,7 @@ class RequestResponseCycle:
 
                 self.message_event.set()
 
-                if self.access_log:
+                if self.access_log_fields is not None:
                     if self.access_log_format is None:
                         self.access_logger.info(
                             '%s - "%s %s HTTP/%s" %d',
@@ -1,4 +1,6 @@
+import array
 import asyncio
+import re
 import time
 import urllib.parse
 from typing import TYPE_CHECKING, Optional, Tuple
@@ -44,71 +46,89 @@ def get_client_addr(scope: "WWWScope") -> str:
     client = scope.get("client")
     if not client:
         return ""
-    return "%s:%d" % client
+    return f"{client[0]}:{client[1]}"
+
+
+# Paths made only of these characters are left as they are by `quote()`.
+SAFE_PATH_RE = re.compile(r"\A[A-Za-z0-9/_.~-]*\Z")
 
 
 def get_path_with_query_string(scope: "WWWScope") -> str:
-    path_with_query_string = urllib.parse.quote(scope["path"])
-    if scope["query_string"]:
-        path_with_query_string = "{}?{}".format(
-            path_with_query_string, scope["query_string"].decode("ascii")
-        )
-    return path_with_query_string
+    path = scope["path"]
+    if not SAFE_PATH_RE.match(path):
+        path = urllib.parse.quote(path)
+    query_string = scope["query_string"]
+    if query_string:
+        return path + "?" + query_string.decode("latin-1")
+    return path
 
 
 class RequestResponseTiming:
-    # XXX: switch to "time.perf_counter" because apparently on windows
-    # time.monotonis is using GetTickCount64 which has ~15ms resolution (it
-    # caused problems in tests on windows)
-    #
-    # ref: https://github.com/python-trio/trio/issues/33#issue-202432431
+    """
+    Timestamps of a request/response cycle, in integer nanoseconds from
+    `time.perf_counter_ns()`, which unlike `time.monotonic()` has a usable
+    resolution on Windows.
+
+    ref: https://github.com/python-trio/trio/issues/33#issue-202432431
+    """
+
+    __slots__ = ("_timestamps",)
+
     def __init__(self) -> None:
-        self._request_start_time: Optional[float] = None
-        self._request_end_time: Optional[float] = None
-        self._response_start_time: Optional[float] = None
-        self._response_end_time: Optional[float] = None
+        # request start, request end, response start and response end, where 0
+        # marks a timestamp that was not recorded yet.
+        self._timestamps = array.array("q", [0, 0, 0, 0])
 
-    def request_started(self) -> None:
-        self._request_start_time = time.monotonic()
+    def _timestamp(self, index: int, name: str) -> int:
+        timestamp = self._timestamps[index]
+        if not timestamp:
+            raise ValueError(f"{name}() was not called")
+        return timestamp
+
+    def request_started(self, timestamp: Optional[int] = None) -> None:
+        """Record the request start, optionally at an earlier `perf_counter_ns`."""
+        self._timestamps[0] = timestamp or time.perf_counter_ns()
 
     @property
     def request_start_time(self) -> float:
-        if self._request_start_time is None:
-            raise ValueError("request_started() was not called")
-        return self._request_start_time
+        return self._timestamp(0, "request_started") * 1e-9
 
     def request_ended(self) -> None:
-        self._request_end_time = time.monotonic()
+        self._timestamps[1] = time.perf_counter_ns()
 
     @property
     def request_end_time(self) -> float:
-        if self._request_end_time is None:
-            raise ValueError("request_ended() was not called")
-        return self._request_end_time
+        return self._timestamp(1, "request_ended") * 1e-9
 
     def response_started(self) -> None:
-        self._response_start_time = time.monotonic()
+        self._timestamps[2] = time.perf_counter_ns()
 
     @property
     def response_start_time(self) -> float:
-        if self._response_start_time is None:
-            raise ValueError("response_started() was not called")
-        return self._response_start_time
+        return self._timestamp(2, "response_started") * 1e-9
 
     def response_ended(self) -> None:
-        self._response_end_time = time.monotonic()
+        self._timestamps[3] = time.perf_counter_ns()
 
     @property
     def response_end_time(self) -> float:
-        if self._response_end_time is None:
-            raise ValueError("response_ended() was not called")
-        return self._response_end_time
+        return self._timestamp(3, "response_ended") * 1e-9
 
     def request_duration_seconds(self) -> float:
-        return self.request_end_time - self.request_start_time
+        return (
+            self._timestamp(1, "request_ended") - self._timestamp(0, "request_started")
+        ) * 1e-9
 
     def response_duration_seconds(self) -> float:
-        return self.response_end_time - self.response_start_time
+        return (
+            self._timestamp(3, "response_ended")
+            - self._timestamp(2, "response_started")
+        ) * 1e-9
+
+    def total_duration_ns(self) -> int:
+        return self._timestamp(3, "response_ended") - self._timestamp(
+            0, "request_started"
+        )
 
     def total_duration_seconds(self) -> float:
-        return self.response_end_time - self.request_start_time
+        return self.total_duration_ns() * 1e-9
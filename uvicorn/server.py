@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, List, Optional, Sequence, Set, Tuple, Union
 import click
 
 from uvicorn.config import Config
+from uvicorn.logging import stop_access_log_listener
 
 if TYPE_CHECKING:
     from uvicorn.protocols.http.h11_impl import H11Protocol
@@ -74,11 +75,15 @@ class Server:
         color_message = "Started server process [" + click.style("%d", fg="cyan") + "]"
         logger.info(message, process_id, extra={"color_message": color_message})
 
-        await self.startup(sockets=sockets)
-        if self.should_exit:
-            return
-        await self.main_loop()
-        await self.shutdown(sockets=sockets)
+        try:
+            await self.startup(sockets=sockets)
+            if self.should_exit:
+                return
+            await self.main_loop()
+            await self.shutdown(sockets=sockets)
+        finally:
+            # Write out the access log lines still queued for the listener.
+            stop_access_log_listener()
 
         message = "Finished server process [%d]"
         color_message = "Finished server process [" + click.style("%d", fg="cyan") + "]"
@@ -281,6 +286,13 @@ class Server:
             while self.server_state.tasks and not self.force_exit:
                 await asyncio.sleep(0.1)
 
+        # Write out access log lines that are still queued or buffered. The
+        # listener hands its handlers back to the logger, flushing them, so the
+        # handlers below are the ones doing the writing.
+        stop_access_log_listener()
+        for handler in logging.getLogger("uvicorn.access").handlers:
+            handler.flush()
+
         # Send the lifespan shutdown event, and wait for application shutdown.
         if not self.force_exit:
             await self.lifespan.shutdown()